@@ -986,6 +986,11 @@ def populate_monsters():
     
     monsters_collection.insert_many(monsters)
     print(f"Populated {len(monsters)} monsters")
+    
+    # Index the fields monsters are looked up by (raid level range, rank, id)
+    monsters_collection.create_index([("level", 1)])
+    monsters_collection.create_index([("rarity", 1)])
+    monsters_collection.create_index([("monster_id", 1)], unique=True)
 
 if __name__ == "__main__":
     populate_monsters()
\ No newline at end of file
@@ -1,4 +1,6 @@
 import random
+import time
+from operator import itemgetter
 from datetime import datetime
 from typing import Dict, List, Tuple
 from Game.Models.Monster import Monster
@@ -6,10 +8,47 @@ from Game.Models.Player import Player
 from Game.Database.database import Database
 from Game.Managers.player_db_connection import handle_player_death, update_player_rewards, update_player_hp
 
+db = Database()
+monsters_collection = db.get_monsters_collection()
+
+# Rarity multipliers applied to monster power, indexed by Rarity (E..S)
+_RARITY_MULT = (1.0, 1.3, 1.6, 2.0, 2.5, 3.0)
+
+# Fields every monster document must provide
+_REQUIRED_MONSTER_FIELDS = itemgetter("monster_id", "name", "level", "rarity")
+
+# Only the fields generate_monsters reads back from the monsters collection
+_MONSTER_PROJECTION = {
+    "_id": 0,
+    "monster_id": 1,
+    "name": 1,
+    "level": 1,
+    "rarity": 1,
+    "monster_type": 1,
+    "hp": 1,
+    "damage": 1,
+    "defense": 1,
+    "experience_reward": 1,
+    "gold_reward": 1,
+    "loot_table": 1
+}
+
+# Per-monster raid outcome codes
+OUTCOME_WON = 0
+OUTCOME_LOST = 1
+OUTCOME_SKIPPED = 2
+
+# Largest factor the mindset roll can apply to a power score
+_MAX_MINDSET_FACTOR = 1.5
+
+def _monster_power(level: int, damage: float, defense: float, rarity_mult: float) -> float:
+    """Monster base power from plain scalars"""
+    return (level * 6 + damage * 1.3 + defense) * rarity_mult
+
 class CombatSystem:
     @staticmethod
-    def calculate_power_score(entity: Player | Monster, is_player: bool = True) -> float:
-        """Calculate power score for either player or monster"""
+    def calculate_base_power(entity: Player | Monster, is_player: bool = True) -> float:
+        """Calculate power score before the mindset factor is applied"""
         base_score = 0
         
         if is_player:
@@ -20,40 +59,65 @@ class CombatSystem:
             base_score += entity.level * 5
             
             # Equipment bonus (we can expand this later)
-            equipment_bonus = entity.calculate_equipment_power()
-            base_score += equipment_bonus
+            base_score += entity.equipment_power
         else:
             # Monster power calculation
-            base_score += entity.level * 6
-            base_score += entity.damage * 1.3
-            base_score += entity.defense
-            
-            # Rarity multipliers
-            rarity_multipliers = {
-                "E": 1.0,
-                "D": 1.3,
-                "C": 1.6,
-                "B": 2.0,
-                "A": 2.5,
-                "S": 3.0
-            }
-            base_score *= rarity_multipliers.get(entity.rarity, 1.0)
+            base_score = _monster_power(
+                entity.level,
+                entity.damage,
+                entity.defense,
+                _RARITY_MULT[entity.rarity]
+            )
         
-        # Add randomness factor (mindset variable)
+        return base_score
+
+    @staticmethod
+    def apply_mindset(base_score: float) -> float:
+        """Add randomness factor (mindset variable)"""
         mindset = random.uniform(0, 10)
-        final_score = base_score * (1 + (mindset / 20))  # Mindset can affect up to ±50%
-        
-        return final_score
+        return base_score * (1 + (mindset / 20))  # Mindset can affect up to ±50%
+
+    @staticmethod
+    def calculate_power_score(entity: Player | Monster, is_player: bool = True) -> float:
+        """Calculate power score for either player or monster"""
+        return CombatSystem.apply_mindset(CombatSystem.calculate_base_power(entity, is_player))
+
+    @staticmethod
+    def calculate_monster_powers(monsters: List[Monster]) -> List[float]:
+        """Calculate base power scores for every monster of a raid in one pass"""
+        return [
+            _monster_power(
+                monster.level,
+                monster.damage,
+                monster.defense,
+                _RARITY_MULT[monster.rarity]
+            )
+            for monster in monsters
+        ]
+
+    @staticmethod
+    def player_wins(player_base: float, monster_base: float) -> bool:
+        """
+        Decide a battle from base power scores.
+        Mindset rolls are only drawn when the outcome isn't already certain.
+        """
+        if monster_base * _MAX_MINDSET_FACTOR < player_base:
+            return True
+        if monster_base >= player_base * _MAX_MINDSET_FACTOR:
+            return False
+        return CombatSystem.apply_mindset(player_base) > CombatSystem.apply_mindset(monster_base)
 
 class RaidManager:
+    # Monster pools keyed by (min_level, max_level), stored as (fetched_at, monsters)
+    _monster_cache: Dict[Tuple[int, int], Tuple[float, List[Dict]]] = {}
+    _CACHE_TTL = 300  # seconds
+    # Read position into each shuffled cached pool, keyed like _monster_cache
+    _pool_offsets: Dict[Tuple[int, int], int] = {}
+
     def __init__(self):
         self.combat_system = CombatSystem()
 
     async def generate_monsters(self, tower_level: int, player_level: int) -> List[Monster]:
-        db = Database()
-        monsters_collection = db.get_monsters_collection()
-        
-
         # Calculate level range for monsters
         min_monster_level = max(1, player_level - 2)
         max_monster_level = player_level + 2
@@ -63,26 +127,37 @@ class RaidManager:
             "level": {"$gte": min_monster_level, "$lte": max_monster_level}
         }
         
-        potential_monsters = list(monsters_collection.find(monster_query))
+        # Reuse the cached pool for this level range until it expires
+        cache_key = (min_monster_level, max_monster_level)
+        now = time.time()
+        entry = RaidManager._monster_cache.get(cache_key)
+        if entry is None or now - entry[0] > RaidManager._CACHE_TTL:
+            entry = (now, list(monsters_collection.find(monster_query, _MONSTER_PROJECTION)))
+            RaidManager._monster_cache[cache_key] = entry
+            RaidManager._pool_offsets.pop(cache_key, None)
+        potential_monsters = entry[1]
         
-        # Randomly select monsters
+        # Randomly select monsters by dealing from the shuffled pool,
+        # reshuffling once it runs out
         selected_monsters = []
-        num_monsters = random.randint(3, min(len(potential_monsters), 7))
-        selected_monster_data = random.sample(potential_monsters, num_monsters)
+        pool_size = len(potential_monsters)
+        num_monsters = random.randint(3, min(pool_size, 7))
+        offset = RaidManager._pool_offsets.get(cache_key, pool_size)
+        if offset + num_monsters > pool_size:
+            random.shuffle(potential_monsters)
+            offset = 0
+        RaidManager._pool_offsets[cache_key] = offset + num_monsters
         
-        for monster_data in selected_monster_data:
+        for monster_data in potential_monsters[offset:offset + num_monsters]:
             monster = Monster(
-                monster_id=monster_data["monster_id"],
-                name=monster_data["name"],
-                level=monster_data["level"],
-                rarity=monster_data["rarity"],
-                monster_type=monster_data.get("monster_type", "generic"),
-                hp=monster_data.get("hp", 50),
-                damage=monster_data.get("damage", 5),
-                defense=monster_data.get("defense", 3),
-                experience_reward=monster_data.get("experience_reward", 15),
-                gold_reward=monster_data.get("gold_reward", 10),
-                loot_table=monster_data.get("loot_table", [])
+                *_REQUIRED_MONSTER_FIELDS(monster_data),
+                monster_data.get("monster_type", "generic"),
+                monster_data.get("hp", 50),
+                monster_data.get("damage", 5),
+                monster_data.get("defense", 3),
+                monster_data.get("experience_reward", 15),
+                monster_data.get("gold_reward", 10),
+                monster_data.get("loot_table", [])
             )
             
             selected_monsters.append(monster)
@@ -93,8 +168,8 @@ class RaidManager:
         monsters = await self.generate_monsters(tower_level, player.level)
         
         raid_results = {
-            "monsters_defeated": [],
-            "monsters_defeated_by": [],
+            "monster_names": [monster.name for monster in monsters],
+            "outcomes": [OUTCOME_SKIPPED] * len(monsters),
             "total_rewards": {"gold": 0, "experience": 0},
             "battles": [],
             "raid_complete": False,
@@ -104,36 +179,39 @@ class RaidManager:
             "current_hp": player.current_hp
         }
         
-        for monster in monsters:
+        # Player stats don't change between battles, so score the player once per raid
+        player_power = self.combat_system.calculate_base_power(player, True)
+        monster_powers = self.combat_system.calculate_monster_powers(monsters)
+        
+        for index, (monster, monster_power) in enumerate(zip(monsters, monster_powers)):
             if player.current_hp <= 0:
                 raid_results["player_survived"] = False
                 break
                     
-            battle_result = await self.process_battle(player, monster)
+            battle_result = self.process_battle(player_power, monster, monster_power)
             raid_results["battles"].append(battle_result)
             
             if battle_result["player_won"]:
-                raid_results["monsters_defeated"].append(monster.name)
+                raid_results["outcomes"][index] = OUTCOME_WON
                 raid_results["total_rewards"]["gold"] += battle_result["rewards"]["gold"]
                 raid_results["total_rewards"]["experience"] += battle_result["rewards"]["experience"]
             else:
-                raid_results["monsters_defeated_by"].append(monster.name)
+                raid_results["outcomes"][index] = OUTCOME_LOST
                 player.current_hp -= battle_result["damage_taken"]
                 raid_results["damage_taken"] += battle_result["damage_taken"]
                 if raid_results["player_survived"] <= False:
                     break
                 break
         
-        raid_results["raid_complete"] = len(raid_results["monsters_defeated"]) == len(monsters)
+        raid_results["raid_complete"] = all(
+            outcome == OUTCOME_WON for outcome in raid_results["outcomes"]
+        )
         raid_results["current_hp"] = player.current_hp
         raid_results["max_hp"] = player.max_hp
         return raid_results
 
-    async def process_battle(self, player: Player, monster: Monster) -> Dict:
-        player_power = self.combat_system.calculate_power_score(player, True)
-        monster_power = self.combat_system.calculate_power_score(monster, False)
-            
-        player_wins = player_power > monster_power
+    def process_battle(self, player_power: float, monster: Monster, monster_power: float) -> Dict:
+        player_wins = self.combat_system.player_wins(player_power, monster_power)
         
         rewards = {
             "gold": monster.gold_reward if player_wins else 0,
@@ -150,30 +228,34 @@ class RaidManager:
         }
 
 def create_raid_summary(results: Dict) -> str:
-    summary = "🗡️ **Raid Summary** 🗡️"
+    parts: List[str] = ["🗡️ **Raid Summary** 🗡️"]
     
-    summary += f"\n\u2764\ufe0f  **Health:** {results['current_hp']} / {results['max_hp']}\n"
-    summary += "\n**Monsters Defeated:**\n"
-    for monster_id in results["monsters_defeated"]:
-        summary += f"✅ {monster_id}\n"
+    parts.append(f"\n\u2764\ufe0f  **Health:** {results['current_hp']} / {results['max_hp']}\n")
+    battles = list(zip(results["monster_names"], results["outcomes"]))
+    monsters_defeated = [name for name, outcome in battles if outcome == OUTCOME_WON]
+    monsters_defeated_by = [name for name, outcome in battles if outcome == OUTCOME_LOST]
     
-    if results["monsters_defeated_by"]:
-        summary += "\n**Monsters that Defeated You:**\n"
-        for monster_id in results["monsters_defeated_by"]:
-            summary += f"❌ {monster_id}\n"
+    parts.append("\n**Monsters Defeated:**\n")
+    for monster_id in monsters_defeated:
+        parts.append(f"✅ {monster_id}\n")
     
-    summary += "\n**Rewards:**\n"
-    summary += f"💰 Gold: {results['total_rewards']['gold']:.0f}\n"
-    summary += f"✨ Experience: {results['total_rewards']['experience']:.0f}\n"
+    if monsters_defeated_by:
+        parts.append("\n**Monsters that Defeated You:**\n")
+        for monster_id in monsters_defeated_by:
+            parts.append(f"❌ {monster_id}\n")
+    
+    parts.append("\n**Rewards:**\n")
+    parts.append(f"💰 Gold: {results['total_rewards']['gold']:.0f}\n")
+    parts.append(f"✨ Experience: {results['total_rewards']['experience']:.0f}\n")
     
     if results["raid_complete"]:
-        summary += "\n🏆 Raid Complete! 🏆"
+        parts.append("\n🏆 Raid Complete! 🏆")
     elif results["player_survived"]:
-        summary += "\n⚠️ Raid Abandoned - Retreated safely"
+        parts.append("\n⚠️ Raid Abandoned - Retreated safely")
     else:
-        summary += "\n💀 Raid Failed - Player Defeated"
+        parts.append("\n💀 Raid Failed - Player Defeated")
     
-    return summary
+    return "".join(parts)
 
 async def handle_raid_command(player: Player):
     raid_manager = RaidManager()
@@ -191,12 +273,20 @@ async def handle_raid_command(player: Player):
         
         return summary
     
-    # If player survived, process rewards
-    reward_update = update_player_rewards(
-        player, 
-        results["total_rewards"]["gold"], 
-        results["total_rewards"]["experience"]
+    # If player survived, process rewards (nothing to write if the raid changed nothing)
+    dirty = bool(
+        results["total_rewards"]["gold"]
+        or results["total_rewards"]["experience"]
+        or results["damage_taken"]
     )
+    if dirty:
+        reward_update = update_player_rewards(
+            player, 
+            results["total_rewards"]["gold"], 
+            results["total_rewards"]["experience"]
+        )
+    else:
+        reward_update = {"gold_gained": 0, "experience_gained": 0, "leveled_up": False}
     
     # Generate raid summary
     summary = create_raid_summary(results)
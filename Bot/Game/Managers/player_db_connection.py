@@ -60,14 +60,19 @@ def update_player_rewards(player: Player, gold: int, experience: int) -> dict:
         player.level = new_level
         update_result["new_level"] = new_level
     
+    # Apply the rewards as deltas so concurrent updates to the same player aren't lost
     players_collection.update_one(
         {"discord_id": player.discord_id}, 
-        {"$set": {
-            "current_hp": player.current_hp,
-            "gold": player.gold,
-            "experience": player.experience,
-            "level": player.level
-        }}
+        {
+            "$inc": {
+                "gold": gold,
+                "experience": experience
+            },
+            "$set": {
+                "current_hp": player.current_hp,
+                "level": player.level
+            }
+        }
     )
     
     return update_result
@@ -93,10 +98,10 @@ def handle_player_death(player: Player) -> dict:
     # Update database with new player state
     players_collection.update_one(
         {"discord_id": player.discord_id},
-        {"$set": {
-            "current_hp": player.current_hp,
-            "gold": player.gold,
-        }}
+        {
+            "$inc": {"gold": -gold_loss},
+            "$set": {"current_hp": player.current_hp}
+        }
     )
     
     return death_summary
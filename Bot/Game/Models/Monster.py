@@ -1,13 +1,33 @@
+from enum import IntEnum
 from typing import List, Dict
 from Game.Database.database import Database
 
+class Rarity(IntEnum):
+    """Monster rank, ordered from lowest (E) to highest (S)"""
+    E = 0
+    D = 1
+    C = 2
+    B = 3
+    A = 4
+    S = 5
+
+    @classmethod
+    def parse(cls, value) -> "Rarity":
+        """Convert a stored rank letter to a Rarity, defaulting to E for unknown ranks"""
+        if isinstance(value, cls):
+            return value
+        return cls.__members__.get(str(value).upper(), cls.E)
+
 class Monster:
+    __slots__ = ("monster_id", "name", "level", "rarity", "monster_type", "hp", "damage",
+                 "defense", "experience_reward", "gold_reward", "loot_table")
+
     def __init__(self, monster_id, name, level, rarity, monster_type, hp, damage, defense, 
                  experience_reward, gold_reward, loot_table):
         self.monster_id = monster_id
         self.name = name
         self.level = level
-        self.rarity = rarity  # Add this line
+        self.rarity = Rarity.parse(rarity)
         self.monster_type = monster_type
         self.hp = hp
         self.damage = damage
@@ -22,7 +42,7 @@ class Monster:
             "monster_id": self.monster_id,
             "name": self.name,
             "level": self.level,
-            "rarity": self.rarity,
+            "rarity": self.rarity.name,
             "monster_type": self.monster_type,
             "hp": self.hp,
             "damage": self.damage,
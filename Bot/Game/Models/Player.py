@@ -10,6 +10,15 @@ starter_equipment_versions = {
             "Accessory": ["Wooden Ring", "Bronze Ring", "Iron Ring", "Steel Ring"]
         }
 
+# Per-stat weights used when scoring equipment, keyed by the capitalized
+# stat names stored on equipment documents
+EQUIPMENT_POWER_WEIGHTS = (
+    ("Strength", 1.0),
+    ("Agility", 1.0),
+    ("Intelligence", 1.0),
+    ("Vitality", 1.0)
+)
+
 
 class Player:
     def init(self, discord_id: str, username: str):
@@ -59,6 +68,7 @@ class Player:
         self.stats = stats
         self.max_hp = max_hp
         self.current_hp = current_hp
+        self._equipment_power = None
         self.equipment = equipment
         self.inventory = inventory
         self.inventory_size = inventory_size
@@ -128,22 +138,32 @@ class Player:
         return player
     
    
+    @property
+    def equipment(self) -> Dict:
+        return self._equipment
+
+    @equipment.setter
+    def equipment(self, equipment: Dict) -> None:
+        self._equipment = equipment
+        self._equipment_power = None
+
+    @property
+    def equipment_power(self) -> float:
+        """Equipment power, cached until the equipment changes"""
+        if self._equipment_power is None:
+            self._equipment_power = self.calculate_equipment_power()
+        return self._equipment_power
+
     def calculate_equipment_power(entity):
-        power_stats = {
-            'strength': 1.0,  # Note: lowercase to match your stats dict
-            'agility': 1.0,
-            'intelligence': 1.0,
-            'vitality': 1.0
-        }
-        
         equipment_power = 0
         
         for item in entity.equipment.values():
             if item:
                 # Calculate power based on individual stat weights
+                item_stats = item['stats']
                 item_power = sum(
-                    item['stats'].get(stat.capitalize(), 0) * weight 
-                    for stat, weight in power_stats.items()
+                    item_stats.get(stat, 0) * weight
+                    for stat, weight in EQUIPMENT_POWER_WEIGHTS
                 )
                 
                 # Optional: Add level scaling
@@ -192,6 +212,7 @@ class Player:
         
         # Equip new item
         self.equipment[slot_type] = new_item
+        self._equipment_power = None
 
     def purchase_equipment(self, equipment_id: str, price: int, slot_type: str) -> bool:
         """